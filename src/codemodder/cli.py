@@ -41,6 +41,17 @@ def build_list_action(codemod_registry: CodemodRegistry):
     return ListAction
 
 
+def _dump_json(data) -> str:
+    """Serialize `data` as indented JSON, using `orjson` when it is installed (`codemodder[orjson]`)"""
+    try:
+        import orjson
+    except ImportError:
+        # orjson does not escape non-ASCII characters either
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
 def build_describe_action(codemod_registry: CodemodRegistry):
     class DescribeAction(argparse.Action):
         def _print_codemods(self, args: argparse.Namespace):
@@ -52,7 +63,7 @@ def build_describe_action(codemod_registry: CodemodRegistry):
             results = codemod_registry.describe_codemods(
                 args.codemod_include, args.codemod_exclude
             )
-            print(json.dumps({"results": results}, indent=2))
+            print(_dump_json({"results": results}))
 
         def __call__(self, parser, *args, **kwargs):
             parsed_args: argparse.Namespace = args[0]
@@ -62,6 +73,17 @@ def build_describe_action(codemod_registry: CodemodRegistry):
     return DescribeAction
 
 
+def positive_int(value: str) -> int:
+    """argparse type for arguments that must be a positive integer"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid positive int value: '{value}'")
+    return number
+
+
 class CsvListAction(argparse.Action):
     """
     argparse Action to convert "a,b,c" into ["a", "b", "c"]
@@ -154,7 +176,7 @@ def parse_args(argv, codemod_registry: CodemodRegistry):
     )
     parser.add_argument(
         "--max-workers",
-        type=int,
+        type=positive_int,
         default=1,
         help="maximum number of workers (threads) to use for processing files in parallel",
     )
@@ -1,5 +1,7 @@
 import fnmatch
-import itertools
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional, Sequence
 
@@ -39,20 +41,93 @@ def file_line_patterns(file_path: str | Path, patterns: Sequence[str]):
     ]
 
 
-def filter_files(names: Sequence[str], patterns: Sequence[str], exclude: bool = False):
+def compile_file_patterns(
+    patterns: Sequence[str], exclude: bool = False
+) -> re.Pattern | None:
+    """
+    Combine the given UNIX glob patterns into a single regex that matches a path if any of the patterns do
+
+    Line numbers are stripped from include patterns, while exclude patterns with line numbers are ignored.
+    """
     patterns = (
         [x.split(":")[0] for x in (patterns or [])]
         if not exclude
         # An excluded line should not cause the entire file to be excluded
         else [x for x in (patterns or []) if ":" not in x]
     )
-    return itertools.chain(*[fnmatch.filter(names, pattern) for pattern in patterns])
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _scan_directory(
+    path: str, relative_path: str, excluded_dirs: re.Pattern | None
+) -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    List the files (relative to the parent path) and subdirectories of a single directory
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = f"{relative_path}/{entry.name}" if relative_path else entry.name
+                # Symlinked directories are not followed, just like Path.rglob
+                if entry.is_dir(follow_symlinks=False):
+                    if not (excluded_dirs and excluded_dirs.match(f"{name}/")):
+                        subdirs.append((entry.path, name))
+                elif entry.is_file():
+                    files.append(name)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def discover_files(
+    parent_path: str | Path,
+    excluded_dirs: re.Pattern | None = None,
+    max_workers: int = 1,
+) -> list[str]:
+    """
+    Find all files starting at the parent_path, recursively, scanning up to `max_workers` directories in parallel.
+
+    :param parent_path: str name for starting directory
+    :param excluded_dirs: regex matching directories (relative to parent_path, with a trailing slash) that should not be descended into
+    :param max_workers: maximum number of threads used to scan directories
+
+    :return: list of file paths relative to the parent directory, in no particular order
+    """
+    files: list[str] = []
+    pending_dirs = [(os.fspath(parent_path), "")]
+    if max_workers <= 1:
+        while pending_dirs:
+            found, subdirs = _scan_directory(*pending_dirs.pop(), excluded_dirs)
+            files.extend(found)
+            pending_dirs.extend(subdirs)
+        return files
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(_scan_directory, path, name, excluded_dirs)
+            for path, name in pending_dirs
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, subdirs = future.result()
+                files.extend(found)
+                pending.update(
+                    executor.submit(_scan_directory, path, name, excluded_dirs)
+                    for path, name in subdirs
+                )
+    return files
 
 
 def match_files(
     parent_path: str | Path,
     exclude_paths: Optional[Sequence[str]] = None,
     include_paths: Optional[Sequence[str]] = None,
+    max_workers: int = 1,
 ):
     """
     Find pattern-matching files starting at the parent_path, recursively.
@@ -63,30 +138,28 @@ def match_files(
     :param parent_path: str name for starting directory
     :param exclude_paths: list of UNIX glob patterns to exclude
     :param include_paths: list of UNIX glob patterns to exclude
+    :param max_workers: maximum number of threads used to scan directories
 
     :return: list of <pathlib.PosixPath> files found within (including recursively) the parent directory
     that match the criteria of both exclude and include patterns.
     """
-    all_files = [
-        str(Path(path).relative_to(parent_path))
-        for path in Path(parent_path).rglob("*")
-    ]
-    included_files = set(
-        filter_files(
-            all_files,
-            include_paths if include_paths is not None else DEFAULT_INCLUDED_PATHS,
-        )
+    exclude_paths = (
+        exclude_paths if exclude_paths is not None else DEFAULT_EXCLUDED_PATHS
+    )
+    included = compile_file_patterns(
+        include_paths if include_paths is not None else DEFAULT_INCLUDED_PATHS
     )
-    excluded_files = set(
-        filter_files(
-            all_files,
-            exclude_paths if exclude_paths is not None else DEFAULT_EXCLUDED_PATHS,
-            exclude=True,
-        )
+    excluded = compile_file_patterns(exclude_paths, exclude=True)
+    # Everything below a directory matching an exclude pattern that ends with a
+    # wildcard is excluded too, so there is no need to descend into it
+    excluded_dirs = compile_file_patterns(
+        [pattern for pattern in exclude_paths if pattern.endswith("*")], exclude=True
     )
+    if included is None:
+        return []
 
     return [
-        path
-        for p in sorted(list(included_files - excluded_files))
-        if (path := Path(parent_path).joinpath(p)).is_file()
+        Path(parent_path).joinpath(name)
+        for name in sorted(discover_files(parent_path, excluded_dirs, max_workers))
+        if included.match(name) and not (excluded and excluded.match(name))
     ]
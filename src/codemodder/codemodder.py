@@ -3,6 +3,7 @@ import itertools
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import DefaultDict, Sequence
 
@@ -75,6 +76,65 @@ def log_report(context, argv, elapsed_ms, files_to_analyze):
     logger.info("  write:       %s ms", context.timer.get_time_ms("write"))
 
 
+def files_for_codemod(
+    codemod: BaseCodemod,
+    semgrep_results: ResultSet,
+    semgrep_finding_ids: list[str],
+    files_to_analyze: list[Path],
+) -> list[Path] | None:
+    """Return the files the given codemod should be applied to, or `None` if it can be skipped"""
+    if not isinstance(codemod.detector, SemgrepRuleDetector):
+        # Non-semgrep codemods ignore the semgrep results
+        return files_to_analyze
+
+    # Unfortunately the IDs from semgrep are not fully specified
+    # TODO: eventually we need to be able to use fully specified IDs here
+    if codemod.name not in semgrep_finding_ids:
+        logger.debug(
+            "no results from semgrep for %s, skipping analysis",
+            codemod.id,
+        )
+        return None
+
+    return semgrep_results.files_for_rule(codemod.name)
+
+
+def can_apply_codemods_concurrently(
+    context: CodemodExecutionContext, files_to_analyze: list[Path]
+) -> bool:
+    """
+    Codemods are normally applied one at a time and only files are processed in parallel.
+
+    When there are fewer files than workers the pool would mostly sit idle, so codemods are applied concurrently instead. This is only safe for dry runs: otherwise codemods could overwrite each other's changes to the same file.
+    """
+    return (
+        context.dry_run
+        and context.max_workers > 1
+        and len(files_to_analyze) < context.max_workers
+    )
+
+
+def apply_codemod(
+    context: CodemodExecutionContext,
+    codemod: BaseCodemod,
+    semgrep_results: ResultSet,
+    semgrep_finding_ids: list[str],
+    files_to_analyze: list[Path],
+) -> bool:
+    """Apply the given codemod, returning `False` if it was skipped"""
+    # NOTE: this may be used as a progress indicator by upstream tools
+    logger.info("running codemod %s", codemod.id)
+
+    codemod_files = files_for_codemod(
+        codemod, semgrep_results, semgrep_finding_ids, files_to_analyze
+    )
+    if codemod_files is None:
+        return False
+
+    codemod.apply(context, codemod_files)
+    return True
+
+
 def apply_codemods(
     context: CodemodExecutionContext,
     codemods_to_run: Sequence[BaseCodemod],
@@ -92,28 +152,26 @@ def apply_codemods(
         return
 
     semgrep_finding_ids = semgrep_results.all_rule_ids()
+    args = (semgrep_results, semgrep_finding_ids, files_to_analyze)
+
+    if can_apply_codemods_concurrently(context, files_to_analyze):
+        with ThreadPoolExecutor(max_workers=context.max_workers) as executor:
+            futures = [
+                (codemod, executor.submit(apply_codemod, context, codemod, *args))
+                for codemod in codemods_to_run
+            ]
+            # Report in the given sequence regardless of completion order
+            for codemod, future in futures:
+                if future.result():
+                    record_dependency_update(context.process_dependencies(codemod.id))
+                    context.log_changes(codemod.id)
+        return
 
     # run codemods one at a time making sure to respect the given sequence
     for codemod in codemods_to_run:
-        # NOTE: this may be used as a progress indicator by upstream tools
-        logger.info("running codemod %s", codemod.id)
-
-        if isinstance(codemod.detector, SemgrepRuleDetector):
-            # Unfortunately the IDs from semgrep are not fully specified
-            # TODO: eventually we need to be able to use fully specified IDs here
-            if codemod.name not in semgrep_finding_ids:
-                logger.debug(
-                    "no results from semgrep for %s, skipping analysis",
-                    codemod.id,
-                )
-                continue
-
-            files_to_analyze = semgrep_results.files_for_rule(codemod.name)
-
-        # Non-semgrep codemods ignore the semgrep results
-        codemod.apply(context, files_to_analyze)
-        record_dependency_update(context.process_dependencies(codemod.id))
-        context.log_changes(codemod.id)
+        if apply_codemod(context, codemod, *args):
+            record_dependency_update(context.process_dependencies(codemod.id))
+            context.log_changes(codemod.id)
 
 
 def record_dependency_update(dependency_results: dict[Dependency, PackageStore | None]):
@@ -197,6 +255,7 @@ def run(original_args) -> int:
         context.directory,
         argv.path_exclude,
         included_paths,
+        max_workers=context.max_workers,
     )
 
     full_names = [str(path) for path in files_to_analyze]
@@ -208,12 +267,15 @@ def run(original_args) -> int:
         files_to_analyze,
     )
 
-    apply_codemods(
-        context,
-        codemods_to_run,
-        semgrep_results,
-        files_to_analyze,
-    )
+    try:
+        apply_codemods(
+            context,
+            codemods_to_run,
+            semgrep_results,
+            files_to_analyze,
+        )
+    finally:
+        context.shutdown_executor()
 
     elapsed = datetime.datetime.now() - start
     elapsed_ms = int(elapsed.total_seconds() * 1000)
@@ -3,14 +3,12 @@ from __future__ import annotations
 import functools
 import importlib.resources
 from abc import ABCMeta, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import cached_property
 from importlib.abc import Traversable
 from pathlib import Path
 
-from codemodder.code_directory import file_line_patterns
 from codemodder.codemods.base_detector import BaseDetector
 from codemodder.codemods.base_transformer import BaseTransformerPipeline
 from codemodder.codetf import DetectionTool, Reference, Rule
@@ -69,6 +67,7 @@ class BaseCodemod(metaclass=ABCMeta):
     detector: BaseDetector | None
     transformer: BaseTransformerPipeline
     default_extensions: list[str] | None
+    _default_extensions_set: frozenset[str]
 
     def __init__(
         self,
@@ -79,10 +78,12 @@ class BaseCodemod(metaclass=ABCMeta):
         default_extensions: list[str] | None = None,
     ):
         # Metadata should only be accessed via properties
+        # It is treated as immutable so that derived properties can be cached
         self._metadata = metadata
         self.detector = detector
         self.transformer = transformer
         self.default_extensions = default_extensions or [".py"]
+        self._default_extensions_set = frozenset(self.default_extensions)
 
     @property
     @abstractmethod
@@ -100,7 +101,7 @@ class BaseCodemod(metaclass=ABCMeta):
     def language(self) -> str:
         return self._metadata.language
 
-    @property
+    @cached_property
     def id(self) -> str:
         return f"{self.origin}:{self.language}/{self.name}"
 
@@ -108,7 +109,7 @@ class BaseCodemod(metaclass=ABCMeta):
     def summary(self):
         return self._metadata.summary
 
-    @property
+    @cached_property
     def detection_tool(self) -> DetectionTool | None:
         if self._metadata.tool is None:
             return None
@@ -133,7 +134,7 @@ class BaseCodemod(metaclass=ABCMeta):
             return doc_path.read_text()
         return self._metadata.description
 
-    @property
+    @cached_property
     def review_guidance(self):
         return self._metadata.review_guidance.name.replace("_", " ").title()
 
@@ -149,12 +150,24 @@ class BaseCodemod(metaclass=ABCMeta):
             "references": [ref.model_dump() for ref in self.references],
         }
 
+    def can_apply(self, context: CodemodExecutionContext) -> bool:
+        """
+        Determine whether the inputs required by this codemod's detector (if any) were provided
+        """
+        if self.detector is None:
+            return True
+        return not self.detector.requires_inputs() - context.provided_inputs
+
     def _apply(
         self,
         context: CodemodExecutionContext,
         files_to_analyze: list[Path],
         rules: list[str],
     ) -> None:
+        if not self.can_apply(context):
+            logger.debug("No detector inputs provided for %s, skipping", self.id)
+            return
+
         results = (
             # It seems like semgrep doesn't like our fully-specified id format
             self.detector.apply(self.name, context, files_to_analyze)
@@ -166,25 +179,15 @@ class BaseCodemod(metaclass=ABCMeta):
             logger.debug("No results for %s", self.id)
             return
 
-        files_to_analyze = (
-            [
-                path
-                for path in files_to_analyze
-                if path.suffix in self.default_extensions
-            ]
-            if self.default_extensions
-            else files_to_analyze
-        )
+        extensions = self._default_extensions_set
+        files = (path for path in files_to_analyze if path.suffix in extensions)
 
         process_file = functools.partial(
             self._process_file, context=context, results=results, rules=rules
         )
 
-        with ThreadPoolExecutor() as executor:
-            logger.debug("using executor with %s workers", context.max_workers)
-            contexts = executor.map(process_file, files_to_analyze)
-            executor.shutdown(wait=True)
-
+        # Wait for every file to be processed before reporting any results
+        contexts = list(context.executor.map(process_file, files))
         context.process_results(self.id, contexts)
 
     def apply(
@@ -217,8 +220,7 @@ class BaseCodemod(metaclass=ABCMeta):
         results: ResultSet | None,
         rules: list[str],
     ):
-        line_exclude = file_line_patterns(filename, context.path_exclude)
-        line_include = file_line_patterns(filename, context.path_include)
+        line_exclude, line_include = context.get_line_patterns(filename)
         findings_for_rule = None
         if results is not None:
             findings_for_rule = []
@@ -6,6 +6,14 @@ from codemodder.result import ResultSet
 
 
 class BaseDetector(metaclass=ABCMeta):
+    def requires_inputs(self) -> set[str]:
+        """
+        Names of the tool result inputs (e.g. `sonar`) that this detector needs in order to find any results
+
+        Detectors that perform their own analysis do not require any inputs.
+        """
+        return set()
+
     @abstractmethod
     def apply(
         self,
@@ -1,4 +1,5 @@
 from collections import namedtuple
+from pathlib import Path
 
 import libcst as cst
 from libcst import matchers
@@ -28,6 +29,26 @@ def update_code(file_path, new_code):
         f.write(new_code)
 
 
+def _file_signature(file_path: Path) -> tuple[int, int]:
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def parse_module(context: CodemodExecutionContext, file_path: Path) -> cst.Module:
+    """
+    Parse the given file, reusing the tree parsed by a previous codemod if the file has not changed since
+    """
+    signature = _file_signature(file_path)
+    if (module := context.cst_cache.get(file_path, signature)) is not None:
+        return module
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        module = cst.parse_module(f.read())
+
+    context.cst_cache.put(file_path, signature, module)
+    return module
+
+
 class LibcstResultTransformer(BaseTransformer):
     """
     Transformer class that performs libcst-based transformations on a given file
@@ -60,7 +81,10 @@ class LibcstResultTransformer(BaseTransformer):
     def transform(
         cls, module: cst.Module, results: list[Result] | None, file_context: FileContext
     ) -> cst.Module:
-        wrapper = cst.MetadataWrapper(module)
+        # Some transformers resolve metadata at construction time, before
+        # transform_module() wraps (and deep-copies) the module itself. The
+        # module isn't modified in between so copying it here is unnecessary.
+        wrapper = cst.MetadataWrapper(module, unsafe_skip_copy=True)
         codemod = cls(
             CodemodContext(wrapper=wrapper),
             results,
@@ -254,8 +278,7 @@ class LibcstTransformerPipeline(BaseTransformerPipeline):
 
         try:
             with file_context.timer.measure("parse"):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    source_tree = cst.parse_module(f.read())
+                source_tree = parse_module(context, file_path)
         except Exception:
             file_context.add_failure(file_path)
             logger.exception("error parsing file %s", file_path)
@@ -282,6 +305,8 @@ class LibcstTransformerPipeline(BaseTransformerPipeline):
         if not context.dry_run:
             with file_context.timer.measure("write"):
                 update_code(file_context.file_path, tree.code)
+            # The transformed tree is exactly what was just written to disk
+            context.cst_cache.put(file_path, _file_signature(file_path), tree)
 
         return change_set
 
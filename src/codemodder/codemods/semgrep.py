@@ -52,6 +52,9 @@ class SemgrepRuleDetector(BaseDetector):
 
 
 class SemgrepSarifFileDetector(BaseDetector):
+    def requires_inputs(self) -> set[str]:
+        return {"semgrep"}
+
     def apply(
         self,
         codemod_id: str,
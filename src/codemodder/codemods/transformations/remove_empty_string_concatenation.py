@@ -49,14 +49,12 @@ class RemoveEmptyStringConcatenation(
     def handle_node(
         self, updated_node: cst.BinaryOperation | cst.ConcatenatedString
     ) -> cst.BaseExpression:
-        left = updated_node.left
-        right = updated_node.right
-        if is_empty_string_literal(left):
-            if is_empty_string_literal(right):
-                return cst.SimpleString(value='""')
-            return right
-        if is_empty_string_literal(right):
-            if is_empty_string_literal(left):
-                return cst.SimpleString(value='""')
-            return left
+        left_empty = is_empty_string_literal(updated_node.left)
+        right_empty = is_empty_string_literal(updated_node.right)
+        if left_empty and right_empty:
+            return cst.SimpleString(value='""')
+        if left_empty:
+            return updated_node.right
+        if right_empty:
+            return updated_node.left
         return updated_node
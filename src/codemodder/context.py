@@ -3,10 +3,13 @@ from __future__ import annotations
 import itertools
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import indent
-from typing import TYPE_CHECKING, Iterator, List
+from typing import TYPE_CHECKING, Iterable, List
 
+from codemodder.code_directory import file_line_patterns
 from codemodder.codetf import ChangeSet
 from codemodder.codetf import Result as CodeTFResult
 from codemodder.dependency import (
@@ -19,6 +22,7 @@ from codemodder.logging import log_list, logger
 from codemodder.project_analysis.file_parsers.package_store import PackageStore
 from codemodder.project_analysis.python_repo_manager import PythonRepoManager
 from codemodder.registry import CodemodRegistry
+from codemodder.utils.module_cache import ModuleCache
 from codemodder.utils.timer import Timer
 
 try:
@@ -47,8 +51,10 @@ class CodemodExecutionContext:
     path_include: list[str]
     path_exclude: list[str]
     max_workers: int = 1
+    executor: ThreadPoolExecutor
     tool_result_files_map: dict[str, list[str]]
     llm_client: Client | None = None
+    cst_cache: ModuleCache
 
     def __init__(
         self,
@@ -74,9 +80,18 @@ class CodemodExecutionContext:
         self.path_include = path_include
         self.path_exclude = path_exclude
         self.max_workers = max_workers
+        # Created up front since codemods may be applied concurrently. The
+        # pool only starts its worker threads once work is submitted.
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.tool_result_files_map = tool_result_files_map or {}
+        self.cst_cache = ModuleCache()
+        self._line_patterns_by_file: dict[Path, tuple[list[int], list[int]]] = {}
+        self._results_lock = threading.Lock()
         self.llm_client = self._setup_llm_client()
 
+    def shutdown_executor(self):
+        self.executor.shutdown(wait=True)
+
     def _setup_llm_client(self) -> Client | None:
         if not Client:
             logger.debug("OpenAI API client not available")
@@ -88,6 +103,11 @@ class CodemodExecutionContext:
 
         return Client(api_key=api_key)
 
+    @property
+    def provided_inputs(self) -> set[str]:
+        """Names of the tools for which at least one result file was provided"""
+        return {tool for tool, files in self.tool_result_files_map.items() if files}
+
     def add_results(self, codemod_name: str, change_sets: List[ChangeSet]):
         self._results_by_codemod.setdefault(codemod_name, []).extend(change_sets)
 
@@ -107,6 +127,19 @@ class CodemodExecutionContext:
             for change_set in changes
         ]
 
+    def get_line_patterns(self, file_path: Path) -> tuple[list[int], list[int]]:
+        """
+        Return the excluded and included line numbers for the given file
+
+        These only depend on the path include/exclude patterns so they are computed once per file and shared by all codemods.
+        """
+        if (patterns := self._line_patterns_by_file.get(file_path)) is None:
+            patterns = self._line_patterns_by_file[file_path] = (
+                file_line_patterns(file_path, self.path_exclude),
+                file_line_patterns(file_path, self.path_include),
+            )
+        return patterns
+
     def get_failures(self, codemod_name: str):
         return self._failures_by_codemod.get(codemod_name, [])
 
@@ -166,12 +199,14 @@ class CodemodExecutionContext:
 
         return description
 
-    def process_results(self, codemod_id: str, results: Iterator[FileContext]):
-        for file_context in results:
-            self.add_results(codemod_id, file_context.results)
-            self.add_failures(codemod_id, file_context.failures)
-            self.add_dependencies(codemod_id, file_context.dependencies)
-            self.timer.aggregate(file_context.timer)
+    def process_results(self, codemod_id: str, results: Iterable[FileContext]):
+        # Codemods may be applied concurrently so updates must be serialized
+        with self._results_lock:
+            for file_context in results:
+                self.add_results(codemod_id, file_context.results)
+                self.add_failures(codemod_id, file_context.failures)
+                self.add_dependencies(codemod_id, file_context.dependencies)
+                self.timer.aggregate(file_context.timer)
 
     def compile_results(self, codemods: list[BaseCodemod]) -> list[CodeTFResult]:
         results = []
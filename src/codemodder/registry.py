@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import importlib
 import os
 import re
 from dataclasses import dataclass
 from importlib.metadata import entry_points
 from itertools import chain
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from codemodder.logging import logger
 
@@ -14,12 +15,39 @@ if TYPE_CHECKING:
 
 
 # These are generally not intended to be applied directly so they are excluded by default.
-DEFAULT_EXCLUDED_CODEMODS = [
+DEFAULT_EXCLUDED_CODEMODS = (
     "pixee:python/order-imports",
     "pixee:python/unused-imports",
     # See https://github.com/pixee/codemodder-python/pull/212 for concerns regarding this codemod.
     "pixee:python/fix-empty-sequence-comparison",
-]
+)
+
+
+@dataclass(frozen=True)
+class LazyCodemod:
+    """
+    A codemod that is only imported once it is selected to run
+
+    :param id: the id of the codemod, e.g. `pixee:python/secure-random`
+    :param path: where to import the codemod from, e.g. `core_codemods.secure_random:SecureRandom`
+    """
+
+    id: str
+    path: str
+    default_extensions: tuple[str, ...] = (".py",)
+
+    @property
+    def origin(self) -> str:
+        return self.id.partition(":")[0]
+
+    @property
+    def name(self) -> str:
+        return self.id.partition("/")[2]
+
+    def load(self) -> BaseCodemod:
+        module, _, attr = self.path.partition(":")
+        codemod = getattr(importlib.import_module(module), attr)
+        return codemod() if isinstance(codemod, type) else codemod
 
 
 @dataclass
@@ -31,8 +59,8 @@ class CodemodCollection:
 
 
 class CodemodRegistry:
-    _codemods_by_name: dict[str, BaseCodemod]
-    _codemods_by_id: dict[str, BaseCodemod]
+    _codemods_by_name: dict[str, BaseCodemod | LazyCodemod]
+    _codemods_by_id: dict[str, BaseCodemod | LazyCodemod]
     _default_include_paths: set[str]
 
     def __init__(self):
@@ -50,7 +78,7 @@ class CodemodRegistry:
 
     @property
     def codemods(self):
-        return list(self._codemods_by_name.values())
+        return [self._load(codemod) for codemod in self._codemods_by_name.values()]
 
     @property
     def default_include_paths(self) -> list[str]:
@@ -70,15 +98,30 @@ class CodemodRegistry:
                 )
             )
 
+    def _load(self, codemod: BaseCodemod | LazyCodemod) -> BaseCodemod:
+        if not isinstance(codemod, LazyCodemod):
+            return codemod
+        if not isinstance(loaded := self._codemods_by_id[codemod.id], LazyCodemod):
+            return loaded
+
+        logger.debug('loading codemod "%s" from "%s"', codemod.id, codemod.path)
+        wrapper = codemod.load()
+        self._codemods_by_name[codemod.name] = wrapper
+        self._codemods_by_id[codemod.id] = wrapper
+        return wrapper
+
     def match_codemods(
         self,
-        codemod_include: Optional[list] = None,
-        codemod_exclude: Optional[list] = None,
+        codemod_include: Optional[Sequence[str]] = None,
+        codemod_exclude: Optional[Sequence[str]] = None,
         sast_only=False,
     ) -> list[BaseCodemod]:
         codemod_include = codemod_include or []
         codemod_exclude = codemod_exclude or DEFAULT_EXCLUDED_CODEMODS
 
+        # Codemods are only matched by id, name and origin so that just the
+        # selected ones need to be loaded
+        codemods = list(self._codemods_by_name.values())
         if codemod_exclude and not codemod_include:
             base_codemods = {}
             patterns = [
@@ -87,7 +130,7 @@ class CodemodRegistry:
                 if "*" in exclude
             ]
             names = set(name for name in codemod_exclude if "*" not in name)
-            for codemod in self.codemods:
+            for codemod in codemods:
                 if (
                     codemod.id in names
                     or (codemod.origin == "pixee" and codemod.name in names)
@@ -99,13 +142,13 @@ class CodemodRegistry:
                     base_codemods[codemod.id] = codemod
 
             # Remove duplicates and preserve order
-            return list(base_codemods.values())
+            return [self._load(codemod) for codemod in base_codemods.values()]
 
         matched_codemods = []
         for name in codemod_include:
             if "*" in name:
                 pat = re.compile(name.replace("*", ".*"))
-                pattern_matches = [code for code in self.codemods if pat.match(code.id)]
+                pattern_matches = [code for code in codemods if pat.match(code.id)]
                 matched_codemods.extend(pattern_matches)
                 if not pattern_matches:
                     logger.warning(
@@ -119,12 +162,12 @@ class CodemodRegistry:
                 )
             except KeyError:
                 logger.warning(f"Requested codemod to include '{name}' does not exist.")
-        return matched_codemods
+        return [self._load(codemod) for codemod in matched_codemods]
 
     def describe_codemods(
         self,
-        codemod_include: Optional[list] = None,
-        codemod_exclude: Optional[list] = None,
+        codemod_include: Optional[Sequence[str]] = None,
+        codemod_exclude: Optional[Sequence[str]] = None,
     ) -> list[dict]:
         codemods = self.match_codemods(codemod_include, codemod_exclude)
         return [codemod.describe() for codemod in codemods]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import libcst as cst
+
+# A parsed libcst tree takes roughly 30 times the size of its source, so this
+# keeps the cache to about 64 MB of trees
+DEFAULT_MAX_SOURCE_SIZE = 2 * 1024 * 1024
+
+Signature = tuple[int, int]
+
+
+class ModuleCache:
+    """
+    Cache of parsed modules bounded by the total size of their source
+
+    Entries are keyed by path and only returned while the file signature (mtime, size) still matches. Every codemod visits files in the same order, so evicting the least recently used tree would always drop the one needed next. Instead, once the cache is full new files are not cached at all, while files that are already cached can still be updated.
+    """
+
+    max_size: int
+    size: int
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SOURCE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: dict[Path, tuple[Signature, cst.Module]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: Path, signature: Signature) -> cst.Module | None:
+        with self._lock:
+            if (entry := self._entries.get(path)) is None:
+                return None
+            if entry[0] != signature:
+                self._remove(path)
+                return None
+            return entry[1]
+
+    def put(self, path: Path, signature: Signature, module: cst.Module) -> None:
+        # The size in the signature is that of the source
+        source_size = signature[1]
+        with self._lock:
+            if path in self._entries:
+                self._remove(path)
+            if self.size + source_size > self.max_size:
+                return
+            self._entries[path] = (signature, module)
+            self.size += source_size
+
+    def _remove(self, path: Path) -> None:
+        signature, _ = self._entries.pop(path)
+        self.size -= signature[1]
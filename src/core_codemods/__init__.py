@@ -1,178 +1,351 @@
-from codemodder.registry import CodemodCollection
+import importlib
 
-from .add_requests_timeouts import AddRequestsTimeouts
-from .combine_startswith_endswith import CombineStartswithEndswith
-from .defectdojo.semgrep.avoid_insecure_deserialization import (
-    AvoidInsecureDeserialization,
-)
-from .defectdojo.semgrep.django_secure_set_cookie import DjangoSecureSetCookie
-from .django_debug_flag_on import DjangoDebugFlagOn
-from .django_json_response_type import DjangoJsonResponseType
-from .django_model_without_dunder_str import DjangoModelWithoutDunderStr
-from .django_receiver_on_top import DjangoReceiverOnTop
-from .django_session_cookie_secure_off import DjangoSessionCookieSecureOff
-from .enable_jinja2_autoescape import EnableJinja2Autoescape
-from .exception_without_raise import ExceptionWithoutRaise
-from .file_resource_leak import FileResourceLeak
-from .fix_assert_tuple import FixAssertTuple
-from .fix_async_task_instantiation import FixAsyncTaskInstantiation
-from .fix_dataclass_defaults import FixDataclassDefaults
-from .fix_deprecated_abstractproperty import FixDeprecatedAbstractproperty
-from .fix_deprecated_logging_warn import FixDeprecatedLoggingWarn
-from .fix_empty_sequence_comparison import FixEmptySequenceComparison
-from .fix_float_equality import FixFloatEquality
-from .fix_hasattr_call import TransformFixHasattrCall
-from .fix_math_isclose import FixMathIsClose
-from .fix_missing_self_or_cls import FixMissingSelfOrCls
-from .fix_mutable_params import FixMutableParams
-from .flask_enable_csrf_protection import FlaskEnableCSRFProtection
-from .flask_json_response_type import FlaskJsonResponseType
-from .harden_pickle_load import HardenPickleLoad
-from .harden_pyyaml import HardenPyyaml
-from .harden_ruamel import HardenRuamel
-from .https_connection import HTTPSConnection
-from .jwt_decode_verify import JwtDecodeVerify
-from .lazy_logging import LazyLogging
-from .limit_readline import LimitReadline
-from .literal_or_new_object_identity import LiteralOrNewObjectIdentity
-from .lxml_safe_parser_defaults import LxmlSafeParserDefaults
-from .lxml_safe_parsing import LxmlSafeParsing
-from .numpy_nan_equality import NumpyNanEquality
-from .order_imports import OrderImports
-from .process_creation_sandbox import ProcessSandbox
-from .remove_assertion_in_pytest_raises import RemoveAssertionInPytestRaises
-from .remove_debug_breakpoint import RemoveDebugBreakpoint
-from .remove_future_imports import RemoveFutureImports
-from .remove_module_global import RemoveModuleGlobal
-from .remove_unnecessary_f_str import RemoveUnnecessaryFStr
-from .remove_unused_imports import RemoveUnusedImports
-from .replace_flask_send_file import ReplaceFlaskSendFile
-from .requests_verify import RequestsVerify
-from .secure_flask_cookie import SecureFlaskCookie
-from .secure_flask_session_config import SecureFlaskSessionConfig
-from .secure_random import SecureRandom
-from .sonar.sonar_django_json_response_type import SonarDjangoJsonResponseType
-from .sonar.sonar_django_receiver_on_top import SonarDjangoReceiverOnTop
-from .sonar.sonar_enable_jinja2_autoescape import SonarEnableJinja2Autoescape
-from .sonar.sonar_exception_without_raise import SonarExceptionWithoutRaise
-from .sonar.sonar_fix_assert_tuple import SonarFixAssertTuple
-from .sonar.sonar_fix_float_equality import SonarFixFloatEquality
-from .sonar.sonar_fix_math_isclose import SonarFixMathIsClose
-from .sonar.sonar_fix_missing_self_or_cls import SonarFixMissingSelfOrCls
-from .sonar.sonar_flask_json_response_type import SonarFlaskJsonResponseType
-from .sonar.sonar_jwt_decode_verify import SonarJwtDecodeVerify
-from .sonar.sonar_literal_or_new_object_identity import SonarLiteralOrNewObjectIdentity
-from .sonar.sonar_numpy_nan_equality import SonarNumpyNanEquality
-from .sonar.sonar_remove_assertion_in_pytest_raises import (
-    SonarRemoveAssertionInPytestRaises,
-)
-from .sonar.sonar_secure_random import SonarSecureRandom
-from .sonar.sonar_tempfile_mktemp import SonarTempfileMktemp
-from .sonar.sonar_url_sandbox import SonarUrlSandbox
-from .sql_parameterization import SQLQueryParameterization
-from .str_concat_in_seq_literal import StrConcatInSeqLiteral
-from .subprocess_shell_false import SubprocessShellFalse
-from .tempfile_mktemp import TempfileMktemp
-from .upgrade_sslcontext_minimum_version import UpgradeSSLContextMinimumVersion
-from .upgrade_sslcontext_tls import UpgradeSSLContextTLS
-from .url_sandbox import UrlSandbox
-from .use_defused_xml import UseDefusedXml
-from .use_generator import UseGenerator
-from .use_set_literal import UseSetLiteral
-from .use_walrus_if import UseWalrusIf
-from .with_threading_lock import WithThreadingLock
+from codemodder.registry import CodemodCollection, LazyCodemod
 
+# Codemods are registered by id and import path so that only the ones selected
+# to run are ever imported (along with their third-party dependencies).
 registry = CodemodCollection(
     origin="pixee",
     codemods=[
-        AddRequestsTimeouts,
-        DjangoDebugFlagOn,
-        DjangoSessionCookieSecureOff,
-        EnableJinja2Autoescape,
-        FixDeprecatedAbstractproperty,
-        FixMutableParams,
-        HardenPickleLoad,
-        HardenPyyaml,
-        HardenRuamel,
-        HTTPSConnection,
-        JwtDecodeVerify,
-        LimitReadline,
-        LxmlSafeParserDefaults,
-        LxmlSafeParsing,
-        OrderImports,
-        ProcessSandbox,
-        RemoveFutureImports,
-        RemoveUnnecessaryFStr,
-        RemoveUnusedImports,
-        RequestsVerify,
-        SecureFlaskCookie,
-        SecureRandom,
-        TempfileMktemp,
-        UpgradeSSLContextMinimumVersion,
-        UpgradeSSLContextTLS,
-        UrlSandbox,
-        UseDefusedXml,
-        UseGenerator,
-        UseSetLiteral,
-        UseWalrusIf,
-        WithThreadingLock,
-        SQLQueryParameterization,
-        SecureFlaskSessionConfig,
-        SubprocessShellFalse,
-        FileResourceLeak,
-        DjangoReceiverOnTop,
-        NumpyNanEquality,
-        DjangoJsonResponseType,
-        FlaskJsonResponseType,
-        ExceptionWithoutRaise,
-        LiteralOrNewObjectIdentity,
-        RemoveModuleGlobal,
-        RemoveDebugBreakpoint,
-        CombineStartswithEndswith,
-        FixDeprecatedLoggingWarn,
-        FlaskEnableCSRFProtection,
-        ReplaceFlaskSendFile,
-        FixEmptySequenceComparison,
-        RemoveAssertionInPytestRaises,
-        FixAssertTuple,
-        FixFloatEquality,
-        LazyLogging,
-        StrConcatInSeqLiteral,
-        FixAsyncTaskInstantiation,
-        DjangoModelWithoutDunderStr,
-        TransformFixHasattrCall,
-        FixDataclassDefaults,
-        FixMissingSelfOrCls,
-        FixMathIsClose,
+        LazyCodemod(
+            "pixee:python/add-requests-timeouts",
+            "core_codemods.add_requests_timeouts:AddRequestsTimeouts",
+        ),
+        LazyCodemod(
+            "pixee:python/django-debug-flag-on",
+            "core_codemods.django_debug_flag_on:DjangoDebugFlagOn",
+        ),
+        LazyCodemod(
+            "pixee:python/django-session-cookie-secure-off",
+            "core_codemods.django_session_cookie_secure_off:DjangoSessionCookieSecureOff",
+        ),
+        LazyCodemod(
+            "pixee:python/enable-jinja2-autoescape",
+            "core_codemods.enable_jinja2_autoescape:EnableJinja2Autoescape",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-deprecated-abstractproperty",
+            "core_codemods.fix_deprecated_abstractproperty:FixDeprecatedAbstractproperty",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-mutable-params",
+            "core_codemods.fix_mutable_params:FixMutableParams",
+        ),
+        LazyCodemod(
+            "pixee:python/harden-pickle-load",
+            "core_codemods.harden_pickle_load:HardenPickleLoad",
+        ),
+        LazyCodemod(
+            "pixee:python/harden-pyyaml",
+            "core_codemods.harden_pyyaml:HardenPyyaml",
+        ),
+        LazyCodemod(
+            "pixee:python/harden-ruamel",
+            "core_codemods.harden_ruamel:HardenRuamel",
+        ),
+        LazyCodemod(
+            "pixee:python/https-connection",
+            "core_codemods.https_connection:HTTPSConnection",
+        ),
+        LazyCodemod(
+            "pixee:python/jwt-decode-verify",
+            "core_codemods.jwt_decode_verify:JwtDecodeVerify",
+        ),
+        LazyCodemod(
+            "pixee:python/limit-readline",
+            "core_codemods.limit_readline:LimitReadline",
+        ),
+        LazyCodemod(
+            "pixee:python/safe-lxml-parser-defaults",
+            "core_codemods.lxml_safe_parser_defaults:LxmlSafeParserDefaults",
+        ),
+        LazyCodemod(
+            "pixee:python/safe-lxml-parsing",
+            "core_codemods.lxml_safe_parsing:LxmlSafeParsing",
+        ),
+        LazyCodemod(
+            "pixee:python/order-imports",
+            "core_codemods.order_imports:OrderImports",
+        ),
+        LazyCodemod(
+            "pixee:python/sandbox-process-creation",
+            "core_codemods.process_creation_sandbox:ProcessSandbox",
+        ),
+        LazyCodemod(
+            "pixee:python/remove-future-imports",
+            "core_codemods.remove_future_imports:RemoveFutureImports",
+        ),
+        LazyCodemod(
+            "pixee:python/remove-unnecessary-f-str",
+            "core_codemods.remove_unnecessary_f_str:RemoveUnnecessaryFStr",
+        ),
+        LazyCodemod(
+            "pixee:python/unused-imports",
+            "core_codemods.remove_unused_imports:RemoveUnusedImports",
+        ),
+        LazyCodemod(
+            "pixee:python/requests-verify",
+            "core_codemods.requests_verify:RequestsVerify",
+        ),
+        LazyCodemod(
+            "pixee:python/secure-flask-cookie",
+            "core_codemods.secure_flask_cookie:SecureFlaskCookie",
+        ),
+        LazyCodemod(
+            "pixee:python/secure-random",
+            "core_codemods.secure_random:SecureRandom",
+        ),
+        LazyCodemod(
+            "pixee:python/secure-tempfile",
+            "core_codemods.tempfile_mktemp:TempfileMktemp",
+        ),
+        LazyCodemod(
+            "pixee:python/upgrade-sslcontext-minimum-version",
+            "core_codemods.upgrade_sslcontext_minimum_version:UpgradeSSLContextMinimumVersion",
+        ),
+        LazyCodemod(
+            "pixee:python/upgrade-sslcontext-tls",
+            "core_codemods.upgrade_sslcontext_tls:UpgradeSSLContextTLS",
+        ),
+        LazyCodemod(
+            "pixee:python/url-sandbox",
+            "core_codemods.url_sandbox:UrlSandbox",
+        ),
+        LazyCodemod(
+            "pixee:python/use-defusedxml",
+            "core_codemods.use_defused_xml:UseDefusedXml",
+        ),
+        LazyCodemod(
+            "pixee:python/use-generator",
+            "core_codemods.use_generator:UseGenerator",
+        ),
+        LazyCodemod(
+            "pixee:python/use-set-literal",
+            "core_codemods.use_set_literal:UseSetLiteral",
+        ),
+        LazyCodemod(
+            "pixee:python/use-walrus-if",
+            "core_codemods.use_walrus_if:UseWalrusIf",
+        ),
+        LazyCodemod(
+            "pixee:python/bad-lock-with-statement",
+            "core_codemods.with_threading_lock:WithThreadingLock",
+        ),
+        LazyCodemod(
+            "pixee:python/sql-parameterization",
+            "core_codemods.sql_parameterization:SQLQueryParameterization",
+        ),
+        LazyCodemod(
+            "pixee:python/secure-flask-session-configuration",
+            "core_codemods.secure_flask_session_config:SecureFlaskSessionConfig",
+        ),
+        LazyCodemod(
+            "pixee:python/subprocess-shell-false",
+            "core_codemods.subprocess_shell_false:SubprocessShellFalse",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-file-resource-leak",
+            "core_codemods.file_resource_leak:FileResourceLeak",
+        ),
+        LazyCodemod(
+            "pixee:python/django-receiver-on-top",
+            "core_codemods.django_receiver_on_top:DjangoReceiverOnTop",
+        ),
+        LazyCodemod(
+            "pixee:python/numpy-nan-equality",
+            "core_codemods.numpy_nan_equality:NumpyNanEquality",
+        ),
+        LazyCodemod(
+            "pixee:python/django-json-response-type",
+            "core_codemods.django_json_response_type:DjangoJsonResponseType",
+        ),
+        LazyCodemod(
+            "pixee:python/flask-json-response-type",
+            "core_codemods.flask_json_response_type:FlaskJsonResponseType",
+        ),
+        LazyCodemod(
+            "pixee:python/exception-without-raise",
+            "core_codemods.exception_without_raise:ExceptionWithoutRaise",
+        ),
+        LazyCodemod(
+            "pixee:python/literal-or-new-object-identity",
+            "core_codemods.literal_or_new_object_identity:LiteralOrNewObjectIdentity",
+        ),
+        LazyCodemod(
+            "pixee:python/remove-module-global",
+            "core_codemods.remove_module_global:RemoveModuleGlobal",
+        ),
+        LazyCodemod(
+            "pixee:python/remove-debug-breakpoint",
+            "core_codemods.remove_debug_breakpoint:RemoveDebugBreakpoint",
+        ),
+        LazyCodemod(
+            "pixee:python/combine-startswith-endswith",
+            "core_codemods.combine_startswith_endswith:CombineStartswithEndswith",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-deprecated-logging-warn",
+            "core_codemods.fix_deprecated_logging_warn:FixDeprecatedLoggingWarn",
+        ),
+        LazyCodemod(
+            "pixee:python/flask-enable-csrf-protection",
+            "core_codemods.flask_enable_csrf_protection:FlaskEnableCSRFProtection",
+        ),
+        LazyCodemod(
+            "pixee:python/replace-flask-send-file",
+            "core_codemods.replace_flask_send_file:ReplaceFlaskSendFile",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-empty-sequence-comparison",
+            "core_codemods.fix_empty_sequence_comparison:FixEmptySequenceComparison",
+        ),
+        LazyCodemod(
+            "pixee:python/remove-assertion-in-pytest-raises",
+            "core_codemods.remove_assertion_in_pytest_raises:RemoveAssertionInPytestRaises",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-assert-tuple",
+            "core_codemods.fix_assert_tuple:FixAssertTuple",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-float-equality",
+            "core_codemods.fix_float_equality:FixFloatEquality",
+        ),
+        LazyCodemod(
+            "pixee:python/lazy-logging",
+            "core_codemods.lazy_logging:LazyLogging",
+        ),
+        LazyCodemod(
+            "pixee:python/str-concat-in-sequence-literals",
+            "core_codemods.str_concat_in_seq_literal:StrConcatInSeqLiteral",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-async-task-instantiation",
+            "core_codemods.fix_async_task_instantiation:FixAsyncTaskInstantiation",
+        ),
+        LazyCodemod(
+            "pixee:python/django-model-without-dunder-str",
+            "core_codemods.django_model_without_dunder_str:DjangoModelWithoutDunderStr",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-hasattr-call",
+            "core_codemods.fix_hasattr_call:TransformFixHasattrCall",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-dataclass-defaults",
+            "core_codemods.fix_dataclass_defaults:FixDataclassDefaults",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-missing-self-or-cls",
+            "core_codemods.fix_missing_self_or_cls:FixMissingSelfOrCls",
+        ),
+        LazyCodemod(
+            "pixee:python/fix-math-isclose",
+            "core_codemods.fix_math_isclose:FixMathIsClose",
+        ),
     ],
 )
 
 sonar_registry = CodemodCollection(
     origin="sonar",
     codemods=[
-        SonarNumpyNanEquality,
-        SonarLiteralOrNewObjectIdentity,
-        SonarDjangoReceiverOnTop,
-        SonarExceptionWithoutRaise,
-        SonarFixAssertTuple,
-        SonarRemoveAssertionInPytestRaises,
-        SonarFlaskJsonResponseType,
-        SonarDjangoJsonResponseType,
-        SonarJwtDecodeVerify,
-        SonarFixMissingSelfOrCls,
-        SonarTempfileMktemp,
-        SonarSecureRandom,
-        SonarEnableJinja2Autoescape,
-        SonarUrlSandbox,
-        SonarFixFloatEquality,
-        SonarFixMathIsClose,
+        LazyCodemod(
+            "sonar:python/numpy-nan-equality-S6725",
+            "core_codemods.sonar.sonar_numpy_nan_equality:SonarNumpyNanEquality",
+        ),
+        LazyCodemod(
+            "sonar:python/literal-or-new-object-identity-S5796",
+            "core_codemods.sonar.sonar_literal_or_new_object_identity:SonarLiteralOrNewObjectIdentity",
+        ),
+        LazyCodemod(
+            "sonar:python/django-receiver-on-top-S6552",
+            "core_codemods.sonar.sonar_django_receiver_on_top:SonarDjangoReceiverOnTop",
+        ),
+        LazyCodemod(
+            "sonar:python/exception-without-raise-S3984",
+            "core_codemods.sonar.sonar_exception_without_raise:SonarExceptionWithoutRaise",
+        ),
+        LazyCodemod(
+            "sonar:python/fix-assert-tuple-S5905",
+            "core_codemods.sonar.sonar_fix_assert_tuple:SonarFixAssertTuple",
+        ),
+        LazyCodemod(
+            "sonar:python/remove-assertion-in-pytest-raises-S5915",
+            "core_codemods.sonar.sonar_remove_assertion_in_pytest_raises:SonarRemoveAssertionInPytestRaises",
+        ),
+        LazyCodemod(
+            "sonar:python/flask-json-response-type-S5131",
+            "core_codemods.sonar.sonar_flask_json_response_type:SonarFlaskJsonResponseType",
+        ),
+        LazyCodemod(
+            "sonar:python/django-json-response-type-S5131",
+            "core_codemods.sonar.sonar_django_json_response_type:SonarDjangoJsonResponseType",
+        ),
+        LazyCodemod(
+            "sonar:python/jwt-decode-verify-S5659",
+            "core_codemods.sonar.sonar_jwt_decode_verify:SonarJwtDecodeVerify",
+        ),
+        LazyCodemod(
+            "sonar:python/fix-missing-self-or-cls-S5719",
+            "core_codemods.sonar.sonar_fix_missing_self_or_cls:SonarFixMissingSelfOrCls",
+        ),
+        LazyCodemod(
+            "sonar:python/secure-tempfile-S5445",
+            "core_codemods.sonar.sonar_tempfile_mktemp:SonarTempfileMktemp",
+        ),
+        LazyCodemod(
+            "sonar:python/secure-random-S2245",
+            "core_codemods.sonar.sonar_secure_random:SonarSecureRandom",
+        ),
+        LazyCodemod(
+            "sonar:python/enable-jinja2-autoescape-S5247",
+            "core_codemods.sonar.sonar_enable_jinja2_autoescape:SonarEnableJinja2Autoescape",
+        ),
+        LazyCodemod(
+            "sonar:python/url-sandbox-S5144",
+            "core_codemods.sonar.sonar_url_sandbox:SonarUrlSandbox",
+        ),
+        LazyCodemod(
+            "sonar:python/fix-float-equality-S1244",
+            "core_codemods.sonar.sonar_fix_float_equality:SonarFixFloatEquality",
+        ),
+        LazyCodemod(
+            "sonar:python/fix-math-isclose-S6727",
+            "core_codemods.sonar.sonar_fix_math_isclose:SonarFixMathIsClose",
+        ),
     ],
 )
 
 defectdojo_registry = CodemodCollection(
     origin="defectdojo",
     codemods=[
-        AvoidInsecureDeserialization,
-        DjangoSecureSetCookie,
+        LazyCodemod(
+            "defectdojo:python/avoid-insecure-deserialization",
+            "core_codemods.defectdojo.semgrep.avoid_insecure_deserialization:AvoidInsecureDeserialization",
+        ),
+        LazyCodemod(
+            "defectdojo:python/django-secure-set-cookie",
+            "core_codemods.defectdojo.semgrep.django_secure_set_cookie:DjangoSecureSetCookie",
+        ),
     ],
 )
+
+_CODEMOD_MODULES = {
+    codemod.path.rpartition(":")[2]: codemod.path.partition(":")[0]
+    for collection in (registry, sonar_registry, defectdojo_registry)
+    for codemod in collection.codemods
+}
+
+__all__ = ["registry", "sonar_registry", "defectdojo_registry", *_CODEMOD_MODULES]
+
+
+def __getattr__(name: str):
+    # Codemod classes are resolved on first attribute access (PEP 562)
+    if (module := _CODEMOD_MODULES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -16,6 +16,9 @@ from .results import DefectDojoResultSet
 
 
 class DefectDojoDetector(BaseDetector):
+    def requires_inputs(self) -> set[str]:
+        return {"defectdojo"}
+
     def apply(
         self,
         codemod_id: str,
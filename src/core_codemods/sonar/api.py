@@ -53,6 +53,9 @@ class SonarCodemod(SASTCodemod):
 
 
 class SonarDetector(BaseDetector):
+    def requires_inputs(self) -> set[str]:
+        return {"sonar"}
+
     def apply(
         self,
         codemod_id: str,
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import libcst as cst
@@ -38,8 +39,14 @@ class TestEmptyResults:
         self.run_and_assert(input_code, input_code)
 
 
+@pytest.fixture
+def mock_context(mocker):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield mocker.MagicMock(executor=executor)
+
+
 @pytest.mark.parametrize("ext,call_count", [(".py", 2), (".txt", 1), (".js", 1)])
-def test_filter_apply_by_extension(mocker, ext, call_count):
+def test_filter_apply_by_extension(mocker, mock_context, ext, call_count):
     process_file = mocker.patch("core_codemods.api.CoreCodemod._process_file")
 
     codemod = CoreCodemod(
@@ -49,8 +56,33 @@ def test_filter_apply_by_extension(mocker, ext, call_count):
     )
 
     codemod.apply(
-        mocker.MagicMock(),
+        mock_context,
         [Path("file.py"), Path("file.txt"), Path("file.js"), Path("file2.py")],
     )
 
     assert process_file.call_count == call_count
+
+
+@pytest.mark.parametrize(
+    "provided_inputs,call_count",
+    [(set(), 0), ({"semgrep"}, 0), ({"sonar"}, 1), ({"sonar", "semgrep"}, 1)],
+)
+def test_skip_when_detector_inputs_missing(
+    mocker, mock_context, provided_inputs, call_count
+):
+    process_file = mocker.patch("core_codemods.api.CoreCodemod._process_file")
+    detector = mocker.MagicMock()
+    detector.requires_inputs.return_value = {"sonar"}
+
+    codemod = CoreCodemod(
+        metadata=mocker.MagicMock(),
+        detector=detector,
+        transformer=mocker.MagicMock(),
+    )
+
+    mock_context.provided_inputs = provided_inputs
+
+    codemod.apply(mock_context, [Path("file.py")])
+
+    assert detector.apply.call_count == call_count
+    assert process_file.call_count == call_count
@@ -8,7 +8,7 @@ class TestMatchCodemods:
     @classmethod
     def setup_class(cls):
         cls.registry = load_registered_codemods()
-        cls.codemod_map = cls.registry._codemods_by_name
+        cls.codemod_map = {c.name: c for c in cls.registry.codemods}
         cls.all_ids = [
             c().id if isinstance(c, type) else c.id for c in registry.codemods
         ]
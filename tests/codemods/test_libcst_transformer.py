@@ -0,0 +1,93 @@
+import os
+
+import mock
+
+from codemodder.codemods.libcst_transformer import parse_module
+from codemodder.context import CodemodExecutionContext
+from codemodder.utils.module_cache import ModuleCache
+
+
+def make_context(tmp_path):
+    return CodemodExecutionContext(
+        directory=tmp_path,
+        dry_run=False,
+        verbose=False,
+        registry=mock.MagicMock(),
+        repo_manager=mock.MagicMock(),
+        path_include=[],
+        path_exclude=[],
+    )
+
+
+def test_parse_module_cached(tmp_path):
+    code = tmp_path / "code.py"
+    code.write_text("x = 1\n")
+    context = make_context(tmp_path)
+
+    module = parse_module(context, code)
+
+    assert module.code == "x = 1\n"
+    assert parse_module(context, code) is module
+
+
+def test_parse_module_file_changed(tmp_path):
+    code = tmp_path / "code.py"
+    code.write_text("x = 1\n")
+    context = make_context(tmp_path)
+
+    module = parse_module(context, code)
+    code.write_text("x = 12\n")
+
+    assert parse_module(context, code) is not module
+    assert parse_module(context, code).code == "x = 12\n"
+
+
+def test_parse_module_same_size_changed(tmp_path):
+    code = tmp_path / "code.py"
+    code.write_text("x = 1\n")
+    context = make_context(tmp_path)
+
+    parse_module(context, code)
+    stat = code.stat()
+    code.write_text("x = 2\n")
+    os.utime(code, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert parse_module(context, code).code == "x = 2\n"
+
+
+def test_parse_module_cache_size_limit(tmp_path):
+    context = make_context(tmp_path)
+    context.cst_cache = ModuleCache(max_size=100)
+    files = []
+    for idx in range(10):
+        code = tmp_path / f"code_{idx}.py"
+        code.write_text(f"x = {idx}\n" * 3)
+        files.append(code)
+
+    for _ in range(2):
+        for code in files:
+            assert parse_module(context, code).code == code.read_text()
+
+    # Each file is 18 bytes so only the first five fit
+    assert context.cst_cache.size == 90
+    assert len(context.cst_cache) == 5
+    assert parse_module(context, files[0]) is parse_module(context, files[0])
+    assert parse_module(context, files[-1]) is not parse_module(context, files[-1])
+
+
+def test_parse_module_cache_full_update(tmp_path):
+    code = tmp_path / "code.py"
+    code.write_text("x = 1\n")
+    context = make_context(tmp_path)
+    context.cst_cache = ModuleCache(max_size=6)
+
+    parse_module(context, code)
+    code.write_text("y = 2\n")
+    stat = code.stat()
+    os.utime(code, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    module = parse_module(context, code)
+
+    assert module.code == "y = 2\n"
+    assert parse_module(context, code) is module
+    assert context.cst_cache.size == 6
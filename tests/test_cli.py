@@ -4,7 +4,7 @@ import mock
 import pytest
 
 from codemodder import __version__
-from codemodder.cli import parse_args
+from codemodder.cli import _dump_json, parse_args
 from codemodder.registry import DEFAULT_EXCLUDED_CODEMODS, load_registered_codemods
 from core_codemods import registry as core_registry
 
@@ -107,6 +107,34 @@ class TestParseArgs:
             DEFAULT_EXCLUDED_CODEMODS
         )
 
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    @mock.patch("builtins.print")
+    def test_describe_output_format(self, mock_print, orjson_available):
+        if orjson_available:
+            pytest.importorskip("orjson")
+        modules = {} if orjson_available else {"orjson": None}
+        with mock.patch.dict("sys.modules", modules):
+            with pytest.raises(SystemExit) as err:
+                parse_args(["--describe"], self.registry)
+
+        assert err.value.args[0] == 0
+        output = mock_print.call_args_list[0][0][0]
+        results = json.loads(output)
+        assert output == json.dumps(results, indent=2, ensure_ascii=False)
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_dump_json_non_ascii(self, orjson_available):
+        data = {"summary": "Use “secure” défauts", "references": []}
+        if orjson_available:
+            pytest.importorskip("orjson")
+        modules = {} if orjson_available else {"orjson": None}
+        with mock.patch.dict("sys.modules", modules):
+            output = _dump_json(data)
+
+        assert (
+            output == '{\n  "summary": "Use “secure” défauts",\n  "references": []\n}'
+        )
+
     @mock.patch("codemodder.cli.logger.error")
     def test_bad_output_format(self, error_logger):
         with pytest.raises(SystemExit) as err:
@@ -148,6 +176,20 @@ class TestParseArgs:
             "ambiguous option: --codemod=url-sandbox could match --codemod-exclude, --codemod-include",
         )
 
+    @pytest.mark.parametrize("max_workers", ["0", "-1", "two"])
+    @mock.patch("codemodder.cli.logger.error")
+    def test_bad_max_workers(self, error_logger, max_workers):
+        with pytest.raises(SystemExit) as err:
+            parse_args(
+                ["some/path", "--output", "here.txt", f"--max-workers={max_workers}"],
+                self.registry,
+            )
+        assert err.value.args[0] == 3
+        assert error_logger.call_args_list[0][0] == (
+            "CLI error: %s",
+            f"argument --max-workers: invalid positive int value: '{max_workers}'",
+        )
+
     @pytest.mark.parametrize("codemod", ["secure-random", "pixee:python/secure-random"])
     def test_codemod_name_or_id(self, codemod):
         parse_args(
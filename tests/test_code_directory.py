@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+import codemodder.code_directory
 from codemodder.code_directory import file_line_patterns, match_files
 
 
@@ -108,33 +109,40 @@ class TestMatchFiles:
         )
         self._assert_expected(files, expected)
 
-    def test_include_test_overridden_by_default_excludes(self, mocker):
-        mocker.patch(
-            "codemodder.code_directory.Path.rglob",
-            return_value=[
-                "foo/tests/test_insecure_random.py",
-                "foo/tests/test_make_request.py",
-            ],
-        )
-        mocker.patch(
-            "codemodder.code_directory.Path.is_file",
-            return_value=True,
-        )
-        files = match_files(Path("."), include_paths=["tests/**"])
+    def test_include_test_overridden_by_default_excludes(self, tmp_path):
+        tests_dir = tmp_path / "foo" / "tests"
+        tests_dir.mkdir(parents=True)
+        (tests_dir / "test_insecure_random.py").touch()
+        (tests_dir / "test_make_request.py").touch()
+
+        files = match_files(tmp_path, include_paths=["tests/**"])
         self._assert_expected(files, [])
 
-    def test_include_test_without_default_includes(self, mocker):
-        files = ["foo/tests/test_insecure_random.py", "foo/tests/test_make_request.py"]
-        mocker.patch(
-            "codemodder.code_directory.Path.rglob",
-            return_value=files,
-        )
-        mocker.patch(
-            "codemodder.code_directory.Path.is_file",
-            return_value=True,
-        )
-        result = match_files(Path("."), exclude_paths=[])
-        assert result == [Path(x) for x in files]
+    def test_include_test_without_default_includes(self, tmp_path):
+        tests_dir = tmp_path / "foo" / "tests"
+        tests_dir.mkdir(parents=True)
+        (tests_dir / "test_insecure_random.py").touch()
+        (tests_dir / "test_make_request.py").touch()
+
+        result = match_files(tmp_path, exclude_paths=[])
+        assert result == [
+            tests_dir / "test_insecure_random.py",
+            tests_dir / "test_make_request.py",
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_match_files_max_workers(self, dir_structure, max_workers):
+        assert match_files(dir_structure, max_workers=max_workers) == [
+            dir_structure / "samples" / "insecure_random.py",
+            dir_structure / "samples" / "make_request.py",
+            dir_structure / "samples" / "more_samples" / "empty_for_testing.py",
+        ]
+
+    def test_excluded_dirs_not_scanned(self, mocker, dir_structure):
+        scan = mocker.spy(codemodder.code_directory, "_scan_directory")
+        files = match_files(dir_structure, ["tests/**", "samples/more_samples/*"])
+        self._assert_expected(files, ["insecure_random.py", "make_request.py"])
+        assert [call.args[1] for call in scan.call_args_list] == ["", "samples"]
 
     def test_extract_line_from_pattern(self):
         lines = file_line_patterns(Path("insecure_random.py"), ["insecure_*.py:3"])
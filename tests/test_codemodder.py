@@ -1,7 +1,11 @@
+import logging
+
 import libcst as cst
 import mock
 import pytest
 
+import codemodder.codemodder
+import codemodder.context
 from codemodder.codemodder import find_semgrep_results, run
 from codemodder.diff import create_diff_from_tree
 from codemodder.registry import load_registered_codemods
@@ -24,6 +28,7 @@ def disable_codemod_apply(mocker, request):
         "test_cst_parsing_fails",
         "test_dry_run",
         "test_run_codemod_name_or_id",
+        "test_dry_run_concurrent_codemods",
     ):
         return
     mocker.patch("codemodder.codemods.base_codemod.BaseCodemod.apply")
@@ -160,6 +165,47 @@ class TestRun:
 
         mock_reporting.return_value.write_report.assert_called_once()
 
+    @mock.patch("codemodder.codetf.CodeTF.build")
+    def test_dry_run_concurrent_codemods(
+        self, mock_reporting, mocker, dir_structure, caplog
+    ):
+        executor = mocker.spy(codemodder.codemodder, "ThreadPoolExecutor")
+        shared_executor = mocker.spy(codemodder.context, "ThreadPoolExecutor")
+        code_dir, codetf = dir_structure
+        (code_dir / "test_random.py").write_text(
+            'def func(foo=[]):\n    return f"foo"\n'
+        )
+        args = [
+            str(code_dir),
+            "--output",
+            str(codetf),
+            "--dry-run",
+            "--max-workers=4",
+            "--codemod-include=fix-mutable-params,use-generator,remove-unnecessary-f-str",
+        ]
+
+        caplog.set_level(logging.INFO)
+        res = run(args)
+        assert res == 0
+
+        executor.assert_called_once_with(max_workers=4)
+        # Codemods applied concurrently still share a single pool for files
+        shared_executor.assert_called_once_with(max_workers=4)
+        # Codemods are reported as running once a worker picks them up
+        running = [
+            record for record in caplog.records if record.msg == "running codemod %s"
+        ]
+        assert len(running) == 3
+        assert all(record.threadName != "MainThread" for record in running)
+
+        _, _, _, results_by_codemod = mock_reporting.call_args_list[0][0]
+        assert [result.codemod for result in results_by_codemod] == [
+            "pixee:python/fix-mutable-params",
+            "pixee:python/use-generator",
+            "pixee:python/remove-unnecessary-f-str",
+        ]
+        assert [len(result.changeset) for result in results_by_codemod] == [1, 0, 1]
+
     @pytest.mark.parametrize(
         "codemod", ["use-defusedxml", "pixee:python/use-defusedxml"]
     )
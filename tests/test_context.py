@@ -1,5 +1,6 @@
 import pytest
 
+import codemodder.context
 from codemodder.context import CodemodExecutionContext as Context
 from codemodder.dependency import Security
 from codemodder.project_analysis.python_repo_manager import PythonRepoManager
@@ -77,3 +78,40 @@ class TestContext:
 ```"""
             in description
         )
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_shared_executor(self, mocker, max_workers):
+        context = Context(
+            mocker.Mock(),
+            True,
+            False,
+            mocker.Mock(),
+            mocker.Mock(),
+            [],
+            [],
+            max_workers=max_workers,
+        )
+
+        assert context.executor is context.executor
+        assert context.executor._max_workers == max_workers
+
+        context.shutdown_executor()
+        with pytest.raises(RuntimeError):
+            context.executor.submit(print)
+
+    def test_get_line_patterns(self, mocker, tmp_path):
+        file_path = tmp_path / "code.py"
+        context = Context(
+            tmp_path,
+            True,
+            False,
+            mocker.Mock(),
+            mocker.Mock(),
+            [f"{file_path}:3"],
+            [f"{file_path}:1", "*.py:2", "other.py:4"],
+        )
+        spy = mocker.spy(codemodder.context, "file_line_patterns")
+
+        assert context.get_line_patterns(file_path) == ([1, 2], [3])
+        assert context.get_line_patterns(file_path) == ([1, 2], [3])
+        assert spy.call_count == 2
@@ -1,4 +1,9 @@
-from codemodder.registry import CodemodCollection, CodemodRegistry
+import subprocess
+import sys
+
+import pytest
+
+from codemodder.registry import CodemodCollection, CodemodRegistry, LazyCodemod
 
 
 def test_default_extensions(mocker):
@@ -18,3 +23,62 @@ def test_default_extensions(mocker):
         "*.py",
         "*.txt",
     ]
+
+
+def test_core_codemods_lazy_import():
+    code = (
+        "import sys\n"
+        "from codemodder.registry import load_registered_codemods\n"
+        "registry = load_registered_codemods()\n"
+        "assert 'pixee:python/url-sandbox' in registry.ids\n"
+        "assert 'core_codemods.url_sandbox' not in sys.modules\n"
+        "(codemod,) = registry.match_codemods(['secure-random'])\n"
+        "assert codemod.id == 'pixee:python/secure-random'\n"
+        "assert 'core_codemods.secure_random' in sys.modules\n"
+        "assert 'core_codemods.url_sandbox' not in sys.modules\n"
+        "import core_codemods\n"
+        "assert core_codemods.UrlSandbox.name == 'url-sandbox'\n"
+        "assert 'core_codemods.url_sandbox' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    "collection", ["registry", "sonar_registry", "defectdojo_registry"]
+)
+def test_core_codemods_collections(collection):
+    import core_codemods
+
+    collection = getattr(core_codemods, collection)
+    for lazy_codemod in collection.codemods:
+        codemod = lazy_codemod.load()
+        assert codemod.id == lazy_codemod.id
+        assert codemod.name == lazy_codemod.name
+        assert codemod.origin == lazy_codemod.origin == collection.origin
+        assert tuple(codemod.default_extensions) == lazy_codemod.default_extensions
+
+
+def test_lazy_codemod_loaded_once(mocker):
+    codemod = mocker.MagicMock(id="origin:python/codemod-a")
+    codemod.name = "codemod-a"
+    module = mocker.MagicMock(CodemodA=codemod)
+    import_module = mocker.patch(
+        "codemodder.registry.importlib.import_module", return_value=module
+    )
+    registry = CodemodRegistry()
+    registry.add_codemod_collection(
+        CodemodCollection(
+            origin="origin",
+            codemods=[LazyCodemod("origin:python/codemod-a", "module:CodemodA")],
+        )
+    )
+
+    assert registry.names == ["codemod-a"]
+    import_module.assert_not_called()
+
+    assert registry.match_codemods(["codemod-a", "origin:python/codemod-a"]) == [
+        codemod,
+        codemod,
+    ]
+    assert registry.codemods == [codemod]
+    import_module.assert_called_once_with("module")